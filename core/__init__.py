@@ -1,15 +1,28 @@
 """
 Core 모듈
 Whisper 전사, 요약, 번역, 파일 생성 등의 핵심 기능을 제공합니다.
+
+각 클래스는 처음 접근할 때 해당 서브모듈을 임포트합니다 (PEP 562).
 """
-from .core_whisper import WhisperProcessor
-from .core_summarizer import TextSummarizer
-from .translator import Translator
-from .core_file_handler import FileHandler
+from importlib import import_module
 
 __all__ = [
     'WhisperProcessor',
     'TextSummarizer',
     'Translator',
     'FileHandler'
-]
\ No newline at end of file
+]
+
+# 클래스 이름 -> 정의된 서브모듈
+_SUBMODULES = {
+    'WhisperProcessor': '.core_whisper',
+    'TextSummarizer': '.core_summarizer',
+    'Translator': '.translator',
+    'FileHandler': '.core_file_handler',
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return getattr(import_module(_SUBMODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
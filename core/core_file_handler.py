@@ -3,18 +3,44 @@
 SRT, TXT, PDF 등의 파일을 생성합니다.
 """
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
+from typing import (List, Dict, Optional, Callable, Iterable, Iterator, Sequence, Tuple, Union,
+                    BinaryIO)
+from xml.sax.saxutils import escape
+import numpy as np
 from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
 from utils.logger import info, error, warning
 
 
+# 시간 문자열 조립용 0-패딩 숫자 테이블
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+_THREE_DIGITS = tuple(f"{i:03d}" for i in range(1000))
+
+# PDF 문단 스타일 (모듈 로드 시 한 번만 생성)
+_PDF_STYLES = getSampleStyleSheet()
+_TIMESTAMP_STYLE = ParagraphStyle(
+    'Timestamp', parent=_PDF_STYLES['BodyText'],
+    fontName='Helvetica-Bold', fontSize=10, leading=15, spaceBefore=4, keepWithNext=1
+)
+_SEGMENT_STYLE = ParagraphStyle(
+    'Segment', parent=_PDF_STYLES['BodyText'],
+    fontName='Helvetica', fontSize=12, leading=15, leftIndent=10
+)
+
+
 class FileHandler:
     """파일 생성 및 관리 클래스"""
     
+    # 한 번에 처리(시간 변환, 기록)할 최대 세그먼트 수
+    SEGMENT_CHUNK = 10000
+    # TXT 일괄 생성 시 파일 쓰기 버퍼 크기
+    WRITE_BUFFER = 1 << 20
+    
     @staticmethod
     def format_time(seconds: float) -> str:
         """
@@ -32,9 +58,61 @@ class FileHandler:
         millisecs = int((secs - int(secs)) * 1000)
         return f"{hours:02d}:{minutes:02d}:{int(secs):02d},{millisecs:03d}"
     
+    @staticmethod
+    def format_time_array(
+        starts: Sequence[float],
+        ends: Sequence[float]
+    ) -> List[Tuple[str, str]]:
+        """
+        여러 구간의 시작/끝 시간을 한 번에 SRT 시간 형식으로 변환
+        
+        Args:
+            starts: 시작 시간 목록 (초)
+            ends: 끝 시간 목록 (초)
+            
+        Returns:
+            (시작, 끝) HH:MM:SS,mmm 문자열 튜플 리스트
+        """
+        count = len(starts)
+        times = np.concatenate((
+            np.asarray(starts, dtype=np.float64),
+            np.asarray(ends, dtype=np.float64)
+        ))
+        
+        ms = (times * 1000).astype(np.int64)
+        hours, rem = np.divmod(ms, 3_600_000)
+        minutes, rem = np.divmod(rem, 60_000)
+        secs, millisecs = np.divmod(rem, 1000)
+        
+        two, three = _TWO_DIGITS, _THREE_DIGITS
+        stamps = [
+            f"{two[h] if h < 100 else h}:{two[m]}:{two[sec]},{three[mil]}"
+            for h, m, sec, mil in zip(
+                hours.tolist(), minutes.tolist(), secs.tolist(), millisecs.tolist()
+            )
+        ]
+        return list(zip(stamps[:count], stamps[count:]))
+    
+    @staticmethod
+    def _iter_timed_chunks(
+        segments: Iterable[Dict]
+    ) -> Iterator[Tuple[List[Dict], List[Tuple[str, str]]]]:
+        """세그먼트를 순서대로 청크 단위로 읽어 (세그먼트, 시간 문자열) 쌍으로 반환"""
+        segment_iter = iter(segments)
+        while True:
+            chunk = list(islice(segment_iter, FileHandler.SEGMENT_CHUNK))
+            if not chunk:
+                return
+            
+            time_pairs = FileHandler.format_time_array(
+                [segment["start"] for segment in chunk],
+                [segment["end"] for segment in chunk]
+            )
+            yield chunk, time_pairs
+    
     @staticmethod
     def create_srt(
-        segments: List[Dict],
+        segments: Iterable[Dict],
         output_file: str,
         progress_callback: Optional[Callable] = None
     ) -> bool:
@@ -42,7 +120,7 @@ class FileHandler:
         SRT 자막 파일 생성
         
         Args:
-            segments: 세그먼트 리스트
+            segments: 세그먼트 목록 (제너레이터 가능, 순서대로 한 번만 읽음)
             output_file: 출력 파일 경로
             progress_callback: 진행 상황 콜백
             
@@ -55,16 +133,17 @@ class FileHandler:
             
             info(f"SRT 파일 생성 시작: {output_file}")
             
+            # 세그먼트별로 쓰지 않고 청크 단위로 모아서 한 번에 기록
             with open(output_file, "w", encoding="utf-8") as f:
-                for i, segment in enumerate(segments):
-                    f.write(f"{i+1}\n")
+                index = 1
+                for chunk, time_pairs in FileHandler._iter_timed_chunks(segments):
+                    parts = []
+                    for segment, (start_time, end_time) in zip(chunk, time_pairs):
+                        text = segment['text'].strip()
+                        parts.append(f"{index}\n{start_time} --> {end_time}\n{text}\n\n")
+                        index += 1
                     
-                    start_time = FileHandler.format_time(segment["start"])
-                    end_time = FileHandler.format_time(segment["end"])
-                    f.write(f"{start_time} --> {end_time}\n")
-                    
-                    text = segment['text'].strip()
-                    f.write(f"{text}\n\n")
+                    f.write("".join(parts))
             
             info(f"SRT 파일 생성 완료: {output_file}")
             
@@ -81,31 +160,38 @@ class FileHandler:
     
     @staticmethod
     def create_txt(
-        text: str,
-        output_file: str,
+        text: Union[str, bytes],
+        output_file: Union[str, BinaryIO],
         progress_callback: Optional[Callable] = None
     ) -> bool:
         """
         텍스트 파일 생성
         
         Args:
-            text: 저장할 텍스트
-            output_file: 출력 파일 경로
+            text: 저장할 텍스트 (bytes면 UTF-8로 인코딩된 것으로 보고 그대로 기록)
+            output_file: 출력 파일 경로 또는 열려 있는 바이너리 writer (닫지 않음)
             progress_callback: 진행 상황 콜백
             
         Returns:
             성공 여부
         """
+        name = getattr(output_file, 'name', output_file)
         try:
             if progress_callback:
-                progress_callback(f"TXT 파일 생성 중: {output_file}")
+                progress_callback(f"TXT 파일 생성 중: {name}")
             
-            info(f"TXT 파일 생성 시작: {output_file}")
+            info(f"TXT 파일 생성 시작: {name}")
             
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(text)
+            if hasattr(output_file, 'write'):
+                output_file.write(text if isinstance(text, bytes) else text.encode('utf-8'))
+            elif isinstance(text, bytes):
+                with open(output_file, "wb") as f:
+                    f.write(text)
+            else:
+                with open(output_file, "w", encoding="utf-8") as f:
+                    f.write(text)
             
-            info(f"TXT 파일 생성 완료: {output_file}")
+            info(f"TXT 파일 생성 완료: {name}")
             
             if progress_callback:
                 progress_callback("TXT 파일 생성 완료")
@@ -119,29 +205,51 @@ class FileHandler:
             return False
     
     @staticmethod
-    def _wrap_text(text: str, max_width: int = 60) -> List[str]:
-        """텍스트를 지정된 너비로 래핑"""
-        lines = []
-        current_line = ""
-        words = text.split()
+    def create_txt_batch(
+        items: Sequence[Tuple[str, Union[str, bytes]]],
+        progress_callback: Optional[Callable] = None,
+        max_workers: int = 4
+    ) -> List[str]:
+        """
+        여러 텍스트 파일을 동시에 생성
         
-        for word in words:
-            test_line = f"{current_line} {word}" if current_line else word
-            if len(test_line) <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
+        Args:
+            items: (출력 파일 경로, 텍스트 또는 UTF-8 bytes) 튜플 리스트
+            progress_callback: 진행 상황 콜백
+            max_workers: 동시에 기록할 최대 파일 수
+            
+        Returns:
+            생성에 성공한 파일 경로 리스트 (입력 순서 유지)
+        """
+        if not items:
+            return []
         
-        if current_line:
-            lines.append(current_line)
+        if progress_callback:
+            progress_callback(f"TXT 파일 {len(items)}개 생성 중...")
         
-        return lines
+        def write_one(item) -> bool:
+            output_file, text = item
+            try:
+                with open(output_file, 'wb', buffering=FileHandler.WRITE_BUFFER) as writer:
+                    return FileHandler.create_txt(text, writer)
+            except OSError as e:
+                error(f"TXT 파일 생성 실패: {e}")
+                return False
+        
+        # 인코딩과 디스크 기록을 파일별로 겹쳐서 수행
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            results = list(executor.map(write_one, items))
+        
+        created = [path for (path, _), ok in zip(items, results) if ok]
+        
+        if progress_callback:
+            progress_callback(f"TXT 파일 생성 완료 ({len(created)}/{len(items)})")
+        
+        return created
     
     @staticmethod
     def create_pdf(
-        segments: List[Dict],
+        segments: Iterable[Dict],
         output_file: str,
         title: str = "Transcript",
         full_text: Optional[str] = None,
@@ -152,7 +260,7 @@ class FileHandler:
         PDF 문서 생성
         
         Args:
-            segments: 세그먼트 리스트
+            segments: 세그먼트 목록 (제너레이터 가능, 순서대로 한 번만 읽음)
             output_file: 출력 파일 경로
             title: 문서 제목
             full_text: 전체 텍스트 (선택)
@@ -168,84 +276,44 @@ class FileHandler:
             
             info(f"PDF 파일 생성 시작: {output_file}")
             
-            c = canvas.Canvas(output_file, pagesize=letter)
-            width, height = letter
-            
-            # 여백 설정
-            left_margin = 72  # 1 inch
-            right_margin = width - 72
-            top_margin = height - 72
-            bottom_margin = 72
-            
-            y_position = top_margin
-            line_height = 15
-            
-            # 제목
-            c.setFont("Helvetica-Bold", 16)
-            c.drawString(left_margin, y_position, title)
-            y_position -= line_height * 2
+            # 줄바꿈과 페이지 나누기는 reportlab 레이아웃 엔진에 맡김
+            story = [
+                Paragraph(escape(title), _PDF_STYLES['Title']),
+                Spacer(1, 0.2 * inch)
+            ]
             
             # 요약 (있는 경우)
             if summary_text:
-                c.setFont("Helvetica-Bold", 14)
-                c.drawString(left_margin, y_position, "요약:")
-                y_position -= line_height * 1.5
-                
-                c.setFont("Helvetica", 12)
-                summary_lines = FileHandler._wrap_text(summary_text, 80)
-                for line in summary_lines:
-                    if y_position < bottom_margin:
-                        c.showPage()
-                        y_position = top_margin
-                        c.setFont("Helvetica", 12)
-                    
-                    c.drawString(left_margin + 10, y_position, line)
-                    y_position -= line_height
-                
-                y_position -= line_height
+                story.append(Paragraph("요약:", _PDF_STYLES['Heading2']))
+                story.append(Paragraph(escape(summary_text), _SEGMENT_STYLE))
             
             # 상세 내용
-            c.setFont("Helvetica-Bold", 14)
-            if y_position < bottom_margin:
-                c.showPage()
-                y_position = top_margin
-                c.setFont("Helvetica-Bold", 14)
-            
-            c.drawString(left_margin, y_position, "상세 내용:")
-            y_position -= line_height * 1.5
+            story.append(Paragraph("상세 내용:", _PDF_STYLES['Heading2']))
             
             # 세그먼트별 내용
-            for segment in segments:
-                # 페이지 넘기기 체크
-                if y_position < bottom_margin + line_height * 3:
-                    c.showPage()
-                    y_position = top_margin
-                
-                # 타임스탬프
-                start_time = FileHandler.format_time(segment["start"])
-                end_time = FileHandler.format_time(segment["end"])
-                time_text = f"[{start_time} - {end_time}]"
-                
-                c.setFont("Helvetica-Bold", 10)
-                c.drawString(left_margin, y_position, time_text)
-                y_position -= line_height
-                
-                # 텍스트
-                c.setFont("Helvetica", 12)
-                text_lines = FileHandler._wrap_text(segment['text'].strip(), 80)
-                
-                for line in text_lines:
-                    if y_position < bottom_margin:
-                        c.showPage()
-                        y_position = top_margin
-                        c.setFont("Helvetica", 12)
-                    
-                    c.drawString(left_margin + 10, y_position, line)
-                    y_position -= line_height
+            for chunk, time_pairs in FileHandler._iter_timed_chunks(segments):
+                for segment, (start_time, end_time) in zip(chunk, time_pairs):
+                    story.append(Paragraph(f"[{start_time} - {end_time}]", _TIMESTAMP_STYLE))
+                    story.append(Paragraph(escape(segment['text'].strip()), _SEGMENT_STYLE))
+            
+            doc = SimpleDocTemplate(
+                output_file,
+                pagesize=letter,
+                leftMargin=inch,
+                rightMargin=inch,
+                topMargin=inch,
+                bottomMargin=inch,
+                title=title
+            )
+            
+            if progress_callback:
+                def on_progress(kind, value):
+                    if kind == 'PAGE':
+                        progress_callback(f"PDF 페이지 {value} 생성 중...")
                 
-                y_position -= line_height * 0.5
+                doc.setProgressCallBack(on_progress)
             
-            c.save()
+            doc.build(story)
             
             info(f"PDF 파일 생성 완료: {output_file}")
             
@@ -274,8 +342,20 @@ class FileHandler:
             출력 파일 경로
         """
         input_path = Path(input_file)
-        output_dir = input_path.parent
-        base_name = input_path.stem
+        return FileHandler.build_output_path(input_path.parent, input_path.stem, suffix, extension)
+    
+    @staticmethod
+    def build_output_path(output_dir: Path, base_name: str, suffix: str, extension: str) -> str:
+        """
+        미리 파싱한 디렉토리와 파일명으로 출력 파일 경로 생성
         
-        output_filename = f"{base_name}{suffix}.{extension}"
-        return str(output_dir / output_filename)
+        Args:
+            output_dir: 출력 디렉토리
+            base_name: 확장자를 제외한 입력 파일명
+            suffix: 파일명 접미사 (예: "_summary", "_ko")
+            extension: 파일 확장자 (예: "txt", "srt")
+            
+        Returns:
+            출력 파일 경로
+        """
+        return str(output_dir / f"{base_name}{suffix}.{extension}")
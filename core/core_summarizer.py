@@ -7,7 +7,8 @@ from nltk.tokenize import sent_tokenize
 from sumy.parsers.plaintext import PlaintextParser
 from sumy.nlp.tokenizers import Tokenizer
 from sumy.summarizers.lsa import LsaSummarizer
-from typing import Optional, Callable
+from sumy.utils import get_stop_words
+from typing import List, Optional, Callable
 from utils.logger import info, error, warning
 
 
@@ -16,6 +17,15 @@ class TextSummarizer:
     
     def __init__(self):
         self._ensure_nltk_data()
+        
+        # 토크나이저/요약기는 호출마다 만들지 않고 재사용
+        self._tokenizer = Tokenizer("english")
+        self._summarizer = LsaSummarizer()
+        self._summarizer.stop_words = frozenset(get_stop_words("english"))
+        
+        # 마지막으로 요약한 원본과 문장 분리 결과 (get_summary_stats에서 재사용)
+        self._last_original = None
+        self._last_sentences = None
     
     def _ensure_nltk_data(self):
         """NLTK 데이터 확인 및 다운로드"""
@@ -62,6 +72,9 @@ class TextSummarizer:
             sentences = sent_tokenize(text)
             sentence_count = len(sentences)
             
+            self._last_original = text
+            self._last_sentences = sentences
+            
             info(f"전체 문장 수: {sentence_count}")
             
             # 문장이 너무 적으면 원본 반환
@@ -81,10 +94,8 @@ class TextSummarizer:
                 progress_callback(f"요약 생성 중 ({summary_sentence_count}/{sentence_count} 문장)...")
             
             # LSA 요약 수행
-            parser = PlaintextParser.from_string(text, Tokenizer("english"))
-            summarizer = LsaSummarizer()
-            
-            summary = summarizer(parser.document, summary_sentence_count)
+            parser = PlaintextParser.from_string(text, self._tokenizer)
+            summary = self._summarizer(parser.document, summary_sentence_count)
             summary_text = ' '.join([str(sentence) for sentence in summary])
             
             info(f"요약 완료: {len(summary_text)} 자")
@@ -100,18 +111,30 @@ class TextSummarizer:
                 progress_callback(f"요약 실패: {str(e)}")
             return None
     
-    def get_summary_stats(self, original: str, summary: str) -> dict:
+    def get_summary_stats(
+        self,
+        original: str,
+        summary: str,
+        *,
+        sentences: Optional[List[str]] = None
+    ) -> dict:
         """
         요약 통계 반환
         
         Args:
             original: 원본 텍스트
             summary: 요약 텍스트
+            sentences: 원본의 문장 분리 결과 (없으면 summarize 결과 재사용 또는 새로 분리)
             
         Returns:
             통계 딕셔너리
         """
-        original_sentences = sent_tokenize(original)
+        if sentences is not None:
+            original_sentences = sentences
+        elif original is self._last_original:
+            original_sentences = self._last_sentences
+        else:
+            original_sentences = sent_tokenize(original)
         summary_sentences = sent_tokenize(summary)
         
         return {
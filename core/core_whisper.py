@@ -2,26 +2,48 @@
 Whisper 전사 처리 모듈
 음성/비디오 파일을 텍스트로 변환합니다.
 """
+import gc
+import threading
+import numpy as np
 import whisper
 import torch
+from collections import OrderedDict
 from typing import Dict, Optional, Callable
-from utils.logger import info, error, debug
+from utils.logger import info, error, debug, warning
+
+try:
+    # CPU에서는 CTranslate2 기반 int8 추론이 훨씬 빠름 (선택 의존성)
+    from faster_whisper import WhisperModel as FasterWhisperModel
+except ImportError:
+    FasterWhisperModel = None
 
 
 class WhisperProcessor:
     """Whisper 전사 프로세서 (싱글톤)"""
     
     _instance = None
-    _models = {}  # 모델 캐시
+    _models = OrderedDict()  # 모델 캐시 (LRU 순서)
+    _lock = threading.RLock()  # 모델 캐시/현재 모델 변경 보호
+    _model_released = threading.Condition(_lock)  # 전사가 끝나 모델이 해제 가능해졌음을 알림
+    _model_locks = {}  # 모델 크기 -> 전사 잠금 (디코더 KV 캐시 훅이 모델 모듈에 걸리므로 모델당 한 번에 하나만)
+    _in_use = {}  # 모델 크기 -> 진행 중인 전사 수 (0이 될 때까지 캐시에서 해제하지 않음)
+    
+    current_model_size = None  # 마지막으로 로드한 모델 크기
+    
+    # 동시에 캐시할 최대 모델 수
+    MAX_CUDA_MODELS = 1
+    MAX_CPU_MODELS = 2
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
     
-    def __init__(self):
-        self.current_model = None
-        self.current_model_size = None
+    @property
+    def current_model(self):
+        """마지막으로 로드한 모델 (캐시에서 해제되었으면 None)"""
+        with self._lock:
+            return self._models.get(self.current_model_size)
     
     def get_device_info(self) -> Dict[str, any]:
         """GPU/CPU 정보 반환"""
@@ -48,53 +70,142 @@ class WhisperProcessor:
         Returns:
             성공 여부
         """
-        try:
-            # 이미 로드된 모델이면 재사용
-            if model_size == self.current_model_size and self.current_model is not None:
-                info(f"캐시된 {model_size} 모델 사용")
+        with self._lock:
+            try:
+                # 이미 로드된 모델이면 재사용
+                if model_size == self.current_model_size and self.current_model is not None:
+                    info(f"캐시된 {model_size} 모델 사용")
+                    if progress_callback:
+                        progress_callback(f"캐시된 {model_size} 모델 사용")
+                    return True
+                
+                # 캐시에서 찾기
+                if model_size in self._models:
+                    info(f"캐시에서 {model_size} 모델 로드")
+                    self._models.move_to_end(model_size)
+                    self.current_model_size = model_size
+                    if progress_callback:
+                        progress_callback(f"캐시에서 {model_size} 모델 로드 완료")
+                    return True
+                
+                # 새로 로드
                 if progress_callback:
-                    progress_callback(f"캐시된 {model_size} 모델 사용")
-                return True
-            
-            # 캐시에서 찾기
-            if model_size in self._models:
-                info(f"캐시에서 {model_size} 모델 로드")
-                self.current_model = self._models[model_size]
+                    progress_callback(f"{model_size} 모델 다운로드 및 로드 중...")
+                
+                info(f"{model_size} 모델 로드 시작")
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+                
+                # 새 모델이 들어갈 자리를 먼저 비움
+                max_models = self.MAX_CUDA_MODELS if device == "cuda" else self.MAX_CPU_MODELS
+                self._evict_models(max_models - 1)
+                
+                if device == "cpu" and FasterWhisperModel is not None:
+                    model = FasterWhisperModel(model_size, device="cpu", compute_type="int8")
+                    device = "cpu, int8"
+                else:
+                    if device == "cuda":
+                        # 고정 입력 크기에 맞는 cuDNN 커널을 자동 선택
+                        torch.backends.cudnn.benchmark = True
+                        torch.set_float32_matmul_precision("high")
+                    
+                    model, device = self._load_whisper_model(model_size, device)
+                    
+                    if device == "cuda":
+                        self._warm_up(model)
+                
+                # 캐시에 저장
+                self._models[model_size] = model
                 self.current_model_size = model_size
+                
+                info(f"{model_size} 모델 로드 완료 (device: {device})")
                 if progress_callback:
-                    progress_callback(f"캐시에서 {model_size} 모델 로드 완료")
+                    progress_callback(f"{model_size} 모델 로드 완료")
+                
                 return True
+                
+            except Exception as e:
+                error(f"모델 로드 실패: {e}")
+                if progress_callback:
+                    progress_callback(f"모델 로드 실패: {str(e)}")
+                return False
+    
+    def _load_whisper_model(self, model_size: str, device: str):
+        """
+        openai-whisper 모델 로드 (GPU 메모리 부족시 캐시 정리 후 재시도, 그래도 안되면 CPU 사용)
+        
+        Returns:
+            (모델, 실제 사용된 디바이스) 튜플
+        """
+        try:
+            return whisper.load_model(model_size, device=device), device
+        except torch.cuda.OutOfMemoryError:
+            if device != "cuda":
+                raise
+            warning(f"GPU 메모리 부족, 캐시된 모델을 정리하고 재시도: {model_size}")
+        
+        self._evict_models(0)
+        try:
+            return whisper.load_model(model_size, device="cuda"), "cuda"
+        except torch.cuda.OutOfMemoryError:
+            warning(f"GPU 메모리 부족, CPU로 전환: {model_size}")
+        
+        self._release_memory()
+        return whisper.load_model(model_size, device="cpu"), "cpu"
+    
+    def _evict_models(self, keep: int):
+        """
+        가장 오래 사용하지 않은 모델부터 keep 개만 남기고 해제
+        
+        전사 중인 모델은 해제하지 않고, 해제할 수 있는 모델이 없으면 전사가 끝날 때까지 기다립니다.
+        (_lock 을 잡은 상태에서 호출)
+        """
+        evicted = False
+        while len(self._models) > keep:
+            model_size = next((size for size in self._models if not self._in_use.get(size)), None)
+            if model_size is None:
+                self._model_released.wait()
+                continue
             
-            # 새로 로드
-            if progress_callback:
-                progress_callback(f"{model_size} 모델 다운로드 및 로드 중...")
-            
-            info(f"{model_size} 모델 로드 시작")
-            device = "cuda" if torch.cuda.is_available() else "cpu"
-            model = whisper.load_model(model_size, device=device)
-            
-            # 캐시에 저장
-            self._models[model_size] = model
-            self.current_model = model
-            self.current_model_size = model_size
-            
-            info(f"{model_size} 모델 로드 완료 (device: {device})")
-            if progress_callback:
-                progress_callback(f"{model_size} 모델 로드 완료")
-            
-            return True
-            
+            model = self._models.pop(model_size)
+            self._model_locks.pop(model_size, None)
+            if model_size == self.current_model_size:
+                self.current_model_size = None
+            del model
+            evicted = True
+            info(f"캐시에서 {model_size} 모델 해제")
+        
+        if evicted:
+            self._release_memory()
+    
+    def _release_memory(self):
+        """해제된 모델의 메모리(GPU 포함) 반환"""
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    
+    def _warm_up(self, model):
+        """더미 멜 스펙트로그램으로 인코더를 한 번 실행해 cuDNN 자동 튜닝을 미리 수행"""
+        try:
+            mel = torch.zeros(
+                1, model.dims.n_mels, whisper.audio.N_FRAMES,
+                device=model.device, dtype=torch.float16
+            )
+            with torch.no_grad():
+                model.embed_audio(mel)
+            debug("인코더 워밍업 완료")
         except Exception as e:
-            error(f"모델 로드 실패: {e}")
-            if progress_callback:
-                progress_callback(f"모델 로드 실패: {str(e)}")
-            return False
+            debug(f"인코더 워밍업 건너뜀: {e}")
     
     def transcribe(
         self, 
         file_path: str, 
         language: Optional[str] = None,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        condition_on_previous_text: bool = False,
+        beam_size: Optional[int] = None,
+        best_of: Optional[int] = 1,
+        temperature: float = 0.0,
+        model_size: Optional[str] = None
     ) -> Optional[Dict]:
         """
         파일 전사
@@ -103,26 +214,82 @@ class WhisperProcessor:
             file_path: 전사할 파일 경로
             language: 언어 코드 (None이면 자동 감지)
             progress_callback: 진행 상황 콜백 함수
+            condition_on_previous_text: 이전 구간 텍스트를 다음 구간 프롬프트로 사용할지 여부
+                (끄면 구간 간 의존성이 사라지고 반복 루프가 생기지 않음)
+            beam_size: 빔 서치 크기 (None이면 greedy 디코딩)
+            best_of: 샘플링 시 후보 수
+            temperature: 샘플링 온도 (0이면 온도 폴백 없이 한 번만 디코딩)
+            model_size: 사용할 모델 크기 (None이면 마지막으로 로드한 모델)
             
         Returns:
             전사 결과 딕셔너리 또는 None (실패시)
         """
-        if self.current_model is None:
+        # 모델을 꺼내면서 사용 중으로 표시 (전사가 끝날 때까지 다른 스레드가 캐시에서 해제하지 않음)
+        with self._lock:
+            model_size = model_size or self.current_model_size
+            model = self._models.get(model_size)
+            if model is not None:
+                self._in_use[model_size] = self._in_use.get(model_size, 0) + 1
+                model_lock = self._model_locks.setdefault(model_size, threading.Lock())
+        
+        if model is None:
             error("모델이 로드되지 않았습니다")
             return None
         
+        try:
+            # 같은 모델의 전사는 직렬화 (동시에 돌리면 공유 모듈의 KV 캐시 훅이 서로의 결과를 덮어씀)
+            with model_lock:
+                return self._transcribe_with_model(
+                    model, file_path, language, progress_callback, condition_on_previous_text,
+                    beam_size, best_of, temperature
+                )
+        finally:
+            with self._lock:
+                self._in_use[model_size] -= 1
+                if not self._in_use[model_size]:
+                    del self._in_use[model_size]
+                self._model_released.notify_all()
+    
+    def _transcribe_with_model(
+        self,
+        model,
+        file_path: str,
+        language: Optional[str],
+        progress_callback: Optional[Callable],
+        condition_on_previous_text: bool,
+        beam_size: Optional[int],
+        best_of: Optional[int],
+        temperature: float
+    ) -> Optional[Dict]:
+        """전사 실행 (해당 모델의 전사 잠금을 잡은 상태에서 호출)"""
         try:
             if progress_callback:
                 progress_callback(f"파일 전사 중: {file_path}")
             
             info(f"전사 시작: {file_path}")
             
+            # openai-whisper 와 faster-whisper 가 같은 ffmpeg 디코더(16kHz 모노)를 쓰도록 여기서 디코딩
+            # (openai-whisper 만 보면 경로를 넘겨도 load_audio 를 한 번 호출하므로 비용 차이는 없음)
+            audio = whisper.load_audio(file_path)
+            
             # Whisper 전사 실행
-            result = self.current_model.transcribe(
-                file_path,
-                language=language,
-                verbose=False
-            )
+            decode_options = {
+                'condition_on_previous_text': condition_on_previous_text,
+                'beam_size': beam_size,
+                'best_of': best_of,
+                'temperature': temperature
+            }
+            
+            if FasterWhisperModel is not None and isinstance(model, FasterWhisperModel):
+                result = self._transcribe_faster_whisper(model, audio, language, decode_options)
+            else:
+                result = model.transcribe(
+                    audio,
+                    language=language,
+                    verbose=False,
+                    fp16=next(model.parameters()).is_cuda,
+                    **decode_options
+                )
             
             info(f"전사 완료: {len(result['segments'])} 세그먼트")
             if progress_callback:
@@ -136,11 +303,47 @@ class WhisperProcessor:
                 progress_callback(f"전사 실패: {str(e)}")
             return None
     
+    def _transcribe_faster_whisper(
+        self,
+        model,
+        audio: np.ndarray,
+        language: Optional[str],
+        decode_options: Dict
+    ) -> Dict:
+        """faster-whisper 결과를 openai-whisper와 같은 형식의 딕셔너리로 변환"""
+        options = dict(decode_options)
+        # faster-whisper는 beam_size=1이 greedy 디코딩
+        options['beam_size'] = options['beam_size'] or 1
+        options['best_of'] = options['best_of'] or 1
+        
+        segments_iter, transcription_info = model.transcribe(
+            audio,
+            language=language,
+            **options
+        )
+        
+        segments = [
+            {
+                'id': i,
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text
+            }
+            for i, segment in enumerate(segments_iter)
+        ]
+        
+        return {
+            'text': "".join(segment['text'] for segment in segments),
+            'segments': segments,
+            'language': transcription_info.language
+        }
+    
     def clear_cache(self):
         """모델 캐시 클리어"""
-        self._models.clear()
-        self.current_model = None
-        self.current_model_size = None
+        with self._lock:
+            # 전사 중인 모델은 끝날 때까지 기다렸다가 해제
+            self._evict_models(0)
+            self.current_model_size = None
         info("모델 캐시 클리어됨")
     
     @classmethod
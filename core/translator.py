@@ -2,17 +2,43 @@
 번역 모듈
 텍스트를 다양한 언어로 번역합니다.
 """
-from googletrans import Translator as GoogleTranslator
-from typing import List, Dict, Optional, Callable
+import httpx
+from typing import List, Dict, Optional, Callable, Tuple
 from utils.logger import info, error, warning
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import threading
 import time
 
 
 class Translator:
     """번역 클래스"""
     
+    # Google Translate 공개 엔드포인트 (q를 여러 개 보내면 한 번에 번역)
+    TRANSLATE_URL = "https://translate.googleapis.com/translate_a/t"
+    # 요청 타임아웃 (초)
+    REQUEST_TIMEOUT = 10.0
+    # 한 번의 요청에 담을 최대 문자 수
+    CHUNK_MAX_CHARS = 4000
+    # 동시에 보낼 최대 요청 수
+    MAX_WORKERS = 8
+    # 번역 결과 캐시 크기 (반복되는 짧은 문장용)
+    CACHE_SIZE = 4096
+    # 청크 요청 실패(HTTP 429/5xx, 타임아웃 등) 시 재시도 횟수와 첫 대기 시간 (초, 매번 2배)
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 1.0
+    # 모든 Translator 인스턴스가 공유하는 요청 제한: 동시 요청 수와 요청 시작 간 최소 간격 (초)
+    MAX_CONCURRENT_REQUESTS = 4
+    MIN_REQUEST_INTERVAL = 0.1
+    
+    _request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+    _rate_lock = threading.Lock()
+    _next_request_at = 0.0
+    
     def __init__(self):
-        self.translator = GoogleTranslator()
+        # 연결(TCP+TLS)을 재사용하고 HTTP/2로 동시 요청을 한 연결에 다중화
+        self._client = httpx.Client(http2=True, timeout=self.REQUEST_TIMEOUT)
+        self._translate_cached = lru_cache(maxsize=self.CACHE_SIZE)(self._request_translation)
         self.supported_languages = {
             'ko': '한국어',
             'en': '영어',
@@ -55,14 +81,8 @@ class Translator:
             
             info(f"번역 시작: {len(text)} 자 -> {target_lang}")
             
-            # Google Translate API 호출
-            result = self.translator.translate(
-                text,
-                dest=target_lang,
-                src=source_lang
-            )
-            
-            translated_text = result.text
+            # Google Translate API 호출 (같은 텍스트는 캐시에서 반환)
+            translated_text = self._translate_cached(text, target_lang, source_lang)
             
             info(f"번역 완료: {len(translated_text)} 자")
             
@@ -77,13 +97,69 @@ class Translator:
                 progress_callback(f"번역 실패: {str(e)}")
             return None
     
+    def _request_translation(self, text: str, target_lang: str, source_lang: str) -> str:
+        """단일 텍스트 번역 요청 (lru_cache로 감싸서 사용)"""
+        translated, _ = self._post_translate([text], target_lang, source_lang)[0]
+        return translated
+    
+    def _post_translate(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: str = 'auto'
+    ) -> List[Tuple[str, Optional[str]]]:
+        """
+        여러 텍스트를 한 번의 POST 요청으로 번역
+        
+        Args:
+            texts: 번역할 텍스트 리스트
+            target_lang: 목표 언어
+            source_lang: 원본 언어 (auto면 자동 감지)
+            
+        Returns:
+            (번역된 텍스트, 감지된 언어 코드) 튜플 리스트 (입력 순서와 동일)
+        """
+        with Translator._request_slots:
+            self._wait_for_request_slot()
+            response = self._client.post(
+                self.TRANSLATE_URL,
+                params={'client': 'gtx', 'sl': source_lang, 'tl': target_lang, 'dt': 't'},
+                data={'q': texts}
+            )
+        response.raise_for_status()
+        data = response.json()
+        
+        # q가 하나면 바깥 리스트 없이 "번역" 또는 ["번역", "언어"] 형태로 옴
+        if len(texts) == 1 and (isinstance(data, str) or (data and isinstance(data[0], str))):
+            data = [data]
+        
+        results = []
+        for item in data:
+            if isinstance(item, list):
+                results.append((item[0], item[1] if len(item) > 1 else None))
+            else:
+                results.append((item, None))
+        
+        return results
+    
+    @classmethod
+    def _wait_for_request_slot(cls):
+        """요청 시작 시각이 MIN_REQUEST_INTERVAL 간격이 되도록 대기"""
+        with cls._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, cls._next_request_at)
+            cls._next_request_at = start_at + cls.MIN_REQUEST_INTERVAL
+        
+        if start_at > now:
+            time.sleep(start_at - now)
+    
     def translate_segments(
         self,
         segments: List[Dict],
         target_lang: str,
         source_lang: str = 'auto',
         progress_callback: Optional[Callable] = None,
-        batch_size: int = 10
+        batch_size: int = 30
     ) -> Optional[List[Dict]]:
         """
         세그먼트 목록 번역 (배치 처리)
@@ -93,7 +169,7 @@ class Translator:
             target_lang: 목표 언어
             source_lang: 원본 언어
             progress_callback: 진행 상황 콜백
-            batch_size: 배치 크기
+            batch_size: 요청 하나에 담을 최대 세그먼트 수
             
         Returns:
             번역된 세그먼트 리스트 또는 None (실패시)
@@ -103,38 +179,64 @@ class Translator:
             return None
         
         try:
-            translated_segments = []
+            translated_segments = [segment.copy() for segment in segments]
             total = len(segments)
             
             info(f"세그먼트 번역 시작: {total}개")
             
-            for i, segment in enumerate(segments):
-                if progress_callback:
-                    progress = int((i / total) * 100)
-                    progress_callback(f"세그먼트 번역 중... ({i+1}/{total})")
+            # 언어 감지는 세그먼트마다 하지 않고 앞부분 샘플로 한 번만 수행
+            if source_lang == 'auto':
+                sample = " ".join(
+                    (segment.get('text') or '').strip() for segment in segments[:5]
+                )[:500]
+                if sample.strip():
+                    source_lang = self.detect_language(sample) or 'auto'
+                    info(f"감지된 원본 언어: {source_lang}")
+            
+            chunks = self._build_chunks(segments, batch_size)
+            done = 0
+            progress_lock = threading.Lock()
+            
+            def translate_chunk(chunk_index: int, indices: List[int]) -> List[Optional[str]]:
+                nonlocal done
                 
-                # 세그먼트 복사
-                translated_segment = segment.copy()
+                texts = [segments[i]['text'].strip() for i in indices]
+                try:
+                    pieces = self._translate_chunk(texts, target_lang, source_lang)
+                except Exception as e:
+                    # 재시도까지 실패하면 세그먼트 단위로 다시 요청하지 않고 원본 유지
+                    error(f"청크 {chunk_index + 1} 번역 실패: {e}")
+                    pieces = [None] * len(texts)
                 
-                # 텍스트 번역
-                if segment.get('text'):
-                    translated_text = self.translate_text(
-                        segment['text'].strip(),
-                        target_lang,
-                        source_lang
-                    )
-                    
-                    if translated_text:
-                        translated_segment['text'] = translated_text
-                    else:
-                        # 번역 실패시 원본 유지
-                        warning(f"세그먼트 {i+1} 번역 실패, 원본 유지")
+                if pieces is None:
+                    # 결과 수가 맞지 않을 때만 이 청크를 세그먼트 단위로 번역
+                    warning(f"청크 {chunk_index + 1} 결과 수 불일치, 세그먼트 단위로 재시도")
+                    pieces = [
+                        self.translate_text(text, target_lang, source_lang)
+                        for text in texts
+                    ]
                 
-                translated_segments.append(translated_segment)
+                with progress_lock:
+                    done += len(indices)
+                    if progress_callback:
+                        progress_callback(f"세그먼트 번역 중... ({done}/{total})")
                 
-                # API 제한 방지를 위한 짧은 대기
-                if (i + 1) % batch_size == 0:
-                    time.sleep(0.5)
+                return pieces
+            
+            # 청크 요청을 동시에 보내 네트워크 대기 시간을 겹침
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(translate_chunk, chunk_index, indices)
+                    for chunk_index, indices in enumerate(chunks)
+                ]
+                
+                for indices, future in zip(chunks, futures):
+                    for i, translated_text in zip(indices, future.result()):
+                        if translated_text:
+                            translated_segments[i]['text'] = translated_text
+                        else:
+                            # 번역 실패시 원본 유지
+                            warning(f"세그먼트 {i+1} 번역 실패, 원본 유지")
             
             info(f"세그먼트 번역 완료: {len(translated_segments)}개")
             
@@ -149,6 +251,75 @@ class Translator:
                 progress_callback(f"세그먼트 번역 실패: {str(e)}")
             return None
     
+    def _build_chunks(self, segments: List[Dict], batch_size: int) -> List[List[int]]:
+        """번역할 세그먼트 인덱스를 요청 하나에 담을 크기로 묶음"""
+        chunks = []
+        current = []
+        current_size = 0
+        
+        for i, segment in enumerate(segments):
+            text = (segment.get('text') or '').strip()
+            if not text:
+                continue
+            
+            size = len(text)
+            if current and (current_size + size > self.CHUNK_MAX_CHARS
+                            or len(current) >= batch_size):
+                chunks.append(current)
+                current = []
+                current_size = 0
+            
+            current.append(i)
+            current_size += size
+        
+        if current:
+            chunks.append(current)
+        
+        return chunks
+    
+    def _translate_chunk(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: str
+    ) -> Optional[List[str]]:
+        """
+        여러 텍스트를 한 번의 요청으로 번역
+        
+        HTTP 429/5xx 응답이나 연결 오류, 타임아웃은 지수 백오프로 청크 전체를 재시도합니다.
+        
+        Returns:
+            번역된 텍스트 리스트 또는 None (결과 수가 맞지 않을 때)
+            
+        Raises:
+            httpx.HTTPError: 재시도할 수 없는 오류이거나 재시도를 모두 실패한 경우
+        """
+        delay = self.RETRY_BACKOFF
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                results = self._post_translate(texts, target_lang, source_lang)
+                break
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if attempt == self.MAX_RETRIES or (status != 429 and status < 500):
+                    raise
+                # 429 응답에 Retry-After(초)가 있으면 그만큼 대기
+                retry_after = e.response.headers.get('Retry-After', '')
+                wait = float(retry_after) if retry_after.isdigit() else delay
+            except httpx.TransportError:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                wait = delay
+            
+            warning(f"청크 번역 요청 실패, {wait:.1f}초 후 재시도 ({attempt + 1}/{self.MAX_RETRIES})")
+            time.sleep(wait)
+            delay *= 2
+        
+        if len(results) != len(texts):
+            return None
+        
+        return [translated for translated, _ in results]
+    
     def detect_language(self, text: str) -> Optional[str]:
         """
         언어 감지
@@ -160,12 +331,21 @@ class Translator:
             언어 코드 또는 None
         """
         try:
-            result = self.translator.detect(text)
-            return result.lang
+            _, lang = self._post_translate([text], 'en')[0]
+            return lang
         except Exception as e:
             error(f"언어 감지 실패: {e}")
             return None
     
     def get_supported_languages(self) -> Dict[str, str]:
         """지원하는 언어 목록 반환"""
-        return self.supported_languages.copy()
\ No newline at end of file
+        return self.supported_languages.copy()
+    
+    def close(self):
+        """HTTP 연결 종료"""
+        client = getattr(self, '_client', None)
+        if client is not None:
+            client.close()
+    
+    def __del__(self):
+        self.close()
\ No newline at end of file
@@ -3,18 +3,47 @@
 애플리케이션의 메인 UI
 """
 import os
+from functools import lru_cache
+from pathlib import PurePath
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QFileDialog, QMessageBox,
-                             QGroupBox)
-from PyQt5.QtCore import Qt
+                             QGroupBox, QDialog)
+from PyQt5.QtCore import Qt, QByteArray
 from PyQt5.QtGui import QFont
 
 from ui.widgets import (LanguageSelector, ModelSelector, OutputFormatSelector,
                         SummaryOptions, TranslationOptions)
 from ui.progress_dialog import ProgressDialog
-from workers import TranscriptionWorker
-from utils import (FileValidator, ConfigValidator, get_config, set_config,
-                  info, error)
+from utils import (FileValidator, ConfigValidator, VResult, Config, get_config,
+                  set_config, info, error)
+
+
+_FILE_LABEL_QSS = "padding: 5px; background-color: #f0f0f0; border-radius: 3px;"
+
+_START_BUTTON_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border-radius: 5px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+    }
+"""
+
+
+# QFont 는 QApplication 생성 이후에 만들어야 하므로 첫 사용 시 한 번만 생성
+@lru_cache(maxsize=None)
+def _title_font() -> QFont:
+    return QFont("Arial", 16, QFont.Bold)
+
+
+@lru_cache(maxsize=None)
+def _button_font() -> QFont:
+    return QFont("Arial", 12, QFont.Bold)
 
 
 class MainWindow(QMainWindow):
@@ -46,8 +75,7 @@ class MainWindow(QMainWindow):
         
         # === 제목 ===
         title_label = QLabel("🎙️ Whisper 자막 변환 도구")
-        title_font = QFont("Arial", 16, QFont.Bold)
-        title_label.setFont(title_font)
+        title_label.setFont(_title_font())
         title_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(title_label)
         
@@ -56,7 +84,7 @@ class MainWindow(QMainWindow):
         file_layout = QHBoxLayout(file_group)
         
         self.file_label = QLabel("선택된 파일 없음")
-        self.file_label.setStyleSheet("padding: 5px; background-color: #f0f0f0; border-radius: 3px;")
+        self.file_label.setStyleSheet(_FILE_LABEL_QSS)
         
         self.browse_button = QPushButton("파일 찾기")
         self.browse_button.setMinimumWidth(120)
@@ -99,20 +127,8 @@ class MainWindow(QMainWindow):
         # === 실행 버튼 ===
         self.start_button = QPushButton("🚀 변환 시작")
         self.start_button.setMinimumHeight(50)
-        self.start_button.setFont(QFont("Arial", 12, QFont.Bold))
-        self.start_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.start_button.setFont(_button_font())
+        self.start_button.setStyleSheet(_START_BUTTON_QSS)
         self.start_button.clicked.connect(self._start_conversion)
         
         main_layout.addWidget(self.start_button)
@@ -135,29 +151,44 @@ class MainWindow(QMainWindow):
         """파일 탐색 다이얼로그"""
         last_dir = get_config('last_directory', os.path.expanduser('~'))
         
-        file_path, _ = QFileDialog.getOpenFileName(
+        dialog = QFileDialog(
             self,
             "변환할 파일 선택",
             last_dir,
             "모든 파일 (*);;비디오 파일 (*.mp4 *.avi *.mkv *.mov);;오디오 파일 (*.mp3 *.wav *.ogg *.flac)"
         )
+        dialog.setFileMode(QFileDialog.ExistingFile)
+        
+        # 네트워크 드라이브나 큰 디렉토리에서 파일마다 아이콘/심볼릭 링크를 조회하지 않도록 설정
+        options = (QFileDialog.DontUseCustomDirectoryIcons |
+                   QFileDialog.DontResolveSymlinks |
+                   QFileDialog.ReadOnly)
+        if not get_config('use_native_dialog', True):
+            options |= QFileDialog.DontUseNativeDialog
+        dialog.setOptions(options)
+        
+        file_path = None
+        if dialog.exec_() == QDialog.Accepted:
+            file_path = dialog.selectedFiles()[0]
         
         if file_path:
             # 파일 검증
-            is_valid, message = FileValidator.validate_file(file_path)
+            result = FileValidator.validate_file(file_path)
             
-            if is_valid:
+            if result == VResult.OK:
+                path = PurePath(file_path)
                 self.current_file = file_path
                 self.file_label.setText(file_path)
                 
                 # 마지막 디렉토리 저장
-                set_config('last_directory', os.path.dirname(file_path))
+                set_config('last_directory', str(path.parent))
                 
-                info(f"파일 선택됨: {file_path}")
-                self.statusBar().showMessage(f"파일 선택됨: {os.path.basename(file_path)}")
+                info("파일 선택됨: %s", file_path)
+                self.statusBar().showMessage(f"파일 선택됨: {path.name}")
             else:
+                message = FileValidator.get_message(result, file_path)
                 QMessageBox.warning(self, "파일 검증 실패", message)
-                error(f"파일 검증 실패: {message}")
+                error("파일 검증 실패: %s", message)
     
     def _start_conversion(self):
         """변환 시작"""
@@ -175,7 +206,9 @@ class MainWindow(QMainWindow):
         # 설정 저장
         self._save_settings()
         
-        # 워커 생성
+        # 워커 생성 (whisper/torch 를 끌어오므로 실제 변환 시점에 임포트)
+        from workers import TranscriptionWorker
+        
         summary_opts = self.summary_options.get_options()
         translation_opts = self.translation_options.get_options()
         
@@ -230,7 +263,7 @@ class MainWindow(QMainWindow):
             msg.setText(f"✅ 변환이 완료되었습니다!\n\n생성된 파일 수: {len(files)}")
             
             if files:
-                files_text = "\n".join([f"• {os.path.basename(f)}" for f in files])
+                files_text = "\n".join(f"• {PurePath(f).name}" for f in files)
                 msg.setDetailedText(f"생성된 파일:\n{files_text}")
             
             open_folder_btn = msg.addButton("폴더 열기", QMessageBox.ActionRole)
@@ -240,7 +273,7 @@ class MainWindow(QMainWindow):
             
             # 폴더 열기
             if msg.clickedButton() == open_folder_btn and files:
-                output_dir = os.path.dirname(files[0])
+                output_dir = str(PurePath(files[0]).parent)
                 if os.name == 'nt':  # Windows
                     os.startfile(output_dir)
                 elif os.name == 'posix':  # macOS, Linux
@@ -271,25 +304,26 @@ class MainWindow(QMainWindow):
         
         # 윈도우 지오메트리 복원
         geometry = get_config('window_geometry')
-        if geometry:
-            self.restoreGeometry(geometry)
+        if isinstance(geometry, str) and geometry:
+            self.restoreGeometry(QByteArray.fromHex(geometry.encode('ascii')))
         
         info("설정 로드 완료")
     
     def _save_settings(self):
         """설정 저장하기"""
-        set_config('language', self.language_selector.get_language())
-        set_config('model_size', self.model_selector.get_model_size())
-        set_config('output_formats', self.format_selector.get_formats())
-        
-        summary_opts = self.summary_options.get_options()
-        set_config('enable_summary', summary_opts['enabled'])
-        set_config('summary_ratio', summary_opts['ratio'])
-        
-        translation_opts = self.translation_options.get_options()
-        set_config('enable_translation', translation_opts['enabled'])
-        set_config('target_language', translation_opts['target_language'])
-        
+        with Config.instance().batch():
+            set_config('language', self.language_selector.get_language())
+            set_config('model_size', self.model_selector.get_model_size())
+            set_config('output_formats', self.format_selector.get_formats())
+            
+            summary_opts = self.summary_options.get_options()
+            set_config('enable_summary', summary_opts['enabled'])
+            set_config('summary_ratio', summary_opts['ratio'])
+            
+            translation_opts = self.translation_options.get_options()
+            set_config('enable_translation', translation_opts['enabled'])
+            set_config('target_language', translation_opts['target_language'])
+            
         info("설정 저장 완료")
     
     def _show_about(self):
@@ -328,7 +362,8 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """윈도우 닫기 이벤트"""
         # 윈도우 지오메트리 저장
-        set_config('window_geometry', self.saveGeometry())
+        # (QByteArray 는 JSON 으로 직렬화할 수 없으므로 16진수 문자열로 저장)
+        set_config('window_geometry', bytes(self.saveGeometry()).hex())
         
         # 진행 중인 작업이 있으면 경고
         if self.worker and self.worker.isRunning():
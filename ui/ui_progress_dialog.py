@@ -4,10 +4,23 @@
 """
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QProgressBar, QPushButton, QTextEdit)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 
 
+_ERROR_CHUNK_QSS = """
+    QProgressBar::chunk {
+        background-color: #ff4444;
+    }
+"""
+
+_SUCCESS_CHUNK_QSS = """
+    QProgressBar::chunk {
+        background-color: #44ff44;
+    }
+"""
+
+
 class ProgressDialog(QDialog):
     """
     진행률 표시 다이얼로그
@@ -19,6 +32,9 @@ class ProgressDialog(QDialog):
         - 취소 버튼
     """
     
+    LOG_FLUSH_INTERVAL_MS = 50
+    LOG_MAX_BLOCKS = 2000
+    
     def __init__(self, parent=None, title="작업 진행 중"):
         super().__init__(parent)
         
@@ -27,6 +43,7 @@ class ProgressDialog(QDialog):
         self.setMinimumWidth(600)
         self.setMinimumHeight(400)
         
+        self._pending_log = []
         self._setup_ui()
         self._cancelled = False
     
@@ -54,8 +71,15 @@ class ProgressDialog(QDialog):
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(200)
+        self.log_text.document().setMaximumBlockCount(self.LOG_MAX_BLOCKS)
         layout.addWidget(self.log_text)
         
+        # 로그 줄을 모아서 한 번에 반영하기 위한 타이머
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         # 버튼 영역
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -93,7 +117,20 @@ class ProgressDialog(QDialog):
             message: 상태 메시지
         """
         self.status_label.setText(message)
-        self.log_text.append(message)
+        self._pending_log.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """대기 중인 로그 줄을 한 번에 추가하고 스크롤 이동"""
+        self._log_timer.stop()
+        if not self._pending_log:
+            return
+        
+        self.log_text.setUpdatesEnabled(False)
+        self.log_text.append("\n".join(self._pending_log))
+        self._pending_log.clear()
+        self.log_text.setUpdatesEnabled(True)
         
         # 스크롤을 항상 아래로
         scrollbar = self.log_text.verticalScrollBar()
@@ -107,13 +144,10 @@ class ProgressDialog(QDialog):
             message: 에러 메시지
         """
         self.status_label.setText(f"❌ 에러: {message}")
+        self._flush_log()
         self.log_text.append(f"\n❌ 에러: {message}\n")
         
-        self.progress_bar.setStyleSheet("""
-            QProgressBar::chunk {
-                background-color: #ff4444;
-            }
-        """)
+        self.progress_bar.setStyleSheet(_ERROR_CHUNK_QSS)
         
         self.cancel_button.setEnabled(False)
         self.close_button.setEnabled(True)
@@ -126,13 +160,10 @@ class ProgressDialog(QDialog):
             message: 성공 메시지
         """
         self.status_label.setText(f"✅ {message}")
+        self._flush_log()
         self.log_text.append(f"\n✅ {message}\n")
         
-        self.progress_bar.setStyleSheet("""
-            QProgressBar::chunk {
-                background-color: #44ff44;
-            }
-        """)
+        self.progress_bar.setStyleSheet(_SUCCESS_CHUNK_QSS)
         
         self.cancel_button.setEnabled(False)
         self.close_button.setEnabled(True)
@@ -142,6 +173,7 @@ class ProgressDialog(QDialog):
         self._cancelled = True
         self.cancel_button.setEnabled(False)
         self.status_label.setText("⏸ 취소 요청됨...")
+        self._flush_log()
         self.log_text.append("\n⏸ 사용자가 작업 취소를 요청했습니다.\n")
     
     def is_cancelled(self) -> bool:
@@ -154,6 +186,8 @@ class ProgressDialog(QDialog):
         self.progress_bar.setValue(0)
         self.progress_bar.setStyleSheet("")
         self.status_label.setText("준비 중...")
+        self._log_timer.stop()
+        self._pending_log.clear()
         self.log_text.clear()
         self.cancel_button.setEnabled(True)
         self.close_button.setEnabled(False)
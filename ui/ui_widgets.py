@@ -2,17 +2,45 @@
 커스텀 위젯 모듈
 재사용 가능한 커스텀 UI 컴포넌트들
 """
+from contextlib import contextmanager
 from PyQt5.QtWidgets import (QWidget, QGroupBox, QVBoxLayout, QHBoxLayout, 
                              QLabel, QComboBox, QRadioButton, QButtonGroup,
                              QCheckBox, QSpinBox)
 from PyQt5.QtCore import pyqtSignal
 
 
+class SignalBatchMixin:
+    """
+    프로그램에서 여러 값을 한꺼번에 바꿀 때 변경 시그널을 묶어주는 믹스인
+    
+    suppress_signals() 블록 안에서는 _emit_*() 가 시그널을 보내지 않습니다.
+    """
+    
+    _silenced = False
+    
+    @contextmanager
+    def suppress_signals(self):
+        """블록 안에서 변경 시그널 발생 억제"""
+        self._silenced = True
+        try:
+            yield
+        finally:
+            self._silenced = False
+
+
 class LanguageSelector(QGroupBox):
     """언어 선택 위젯"""
     
     language_changed = pyqtSignal(object)  # None 또는 언어 코드
     
+    _LANGUAGES = (
+        ("자동 감지", None),
+        ("한국어", "ko"),
+        ("영어", "en"),
+        ("일본어", "ja"),
+        ("중국어", "zh"),
+    )
+    
     def __init__(self, title="원본 언어 선택", parent=None):
         super().__init__(title, parent)
         self._setup_ui()
@@ -21,11 +49,9 @@ class LanguageSelector(QGroupBox):
         layout = QVBoxLayout(self)
         
         self.combo = QComboBox()
-        self.combo.addItem("자동 감지", None)
-        self.combo.addItem("한국어", "ko")
-        self.combo.addItem("영어", "en")
-        self.combo.addItem("일본어", "ja")
-        self.combo.addItem("중국어", "zh")
+        for label, code in self._LANGUAGES:
+            self.combo.addItem(label, code)
+        self._index_by_code = {code: i for i, (_, code) in enumerate(self._LANGUAGES)}
         
         self.combo.currentIndexChanged.connect(
             lambda: self.language_changed.emit(self.combo.currentData())
@@ -39,10 +65,9 @@ class LanguageSelector(QGroupBox):
     
     def set_language(self, language):
         """언어 설정"""
-        for i in range(self.combo.count()):
-            if self.combo.itemData(i) == language:
-                self.combo.setCurrentIndex(i)
-                break
+        index = self._index_by_code.get(language)
+        if index is not None:
+            self.combo.setCurrentIndex(index)
 
 
 class ModelSelector(QGroupBox):
@@ -50,6 +75,15 @@ class ModelSelector(QGroupBox):
     
     model_changed = pyqtSignal(str)
     
+    _MODELS = ("tiny", "base", "small", "medium", "large")
+    _LABELS = {
+        "tiny": "Tiny (가장 빠름, 낮은 정확도)",
+        "base": "Base",
+        "small": "Small",
+        "medium": "Medium (권장)",
+        "large": "Large (가장 느림, 높은 정확도)",
+    }
+    
     def __init__(self, title="모델 크기", parent=None):
         super().__init__(title, parent)
         self._setup_ui()
@@ -58,42 +92,38 @@ class ModelSelector(QGroupBox):
         layout = QVBoxLayout(self)
         
         self.button_group = QButtonGroup(self)
+        self._button_by_model = {}
         
-        models = [
-            ("tiny", "Tiny (가장 빠름, 낮은 정확도)"),
-            ("base", "Base"),
-            ("small", "Small"),
-            ("medium", "Medium (권장)"),
-            ("large", "Large (가장 느림, 높은 정확도)")
-        ]
-        
-        for value, label in models:
-            radio = QRadioButton(label)
-            self.button_group.addButton(radio)
-            radio.toggled.connect(lambda checked, v=value: 
-                                self.model_changed.emit(v) if checked else None)
+        # 버튼 ID = _MODELS 인덱스
+        for i, value in enumerate(self._MODELS):
+            radio = QRadioButton(self._LABELS[value])
+            self.button_group.addButton(radio, i)
+            self._button_by_model[value] = radio
             layout.addWidget(radio)
         
+        self.button_group.idToggled.connect(self._on_model_toggled)
+        
         # 기본값: medium
-        self.button_group.buttons()[3].setChecked(True)
+        self._button_by_model["medium"].setChecked(True)
+    
+    def _on_model_toggled(self, button_id, checked):
+        """선택된 모델 변경 시그널 발생"""
+        if checked:
+            self.model_changed.emit(self._MODELS[button_id])
     
     def get_model_size(self):
         """선택된 모델 크기 반환"""
-        models = ["tiny", "base", "small", "medium", "large"]
-        for i, button in enumerate(self.button_group.buttons()):
-            if button.isChecked():
-                return models[i]
-        return "medium"
+        button_id = self.button_group.checkedId()
+        return self._MODELS[button_id] if button_id >= 0 else "medium"
     
     def set_model_size(self, model_size):
         """모델 크기 설정"""
-        models = ["tiny", "base", "small", "medium", "large"]
-        if model_size in models:
-            index = models.index(model_size)
-            self.button_group.buttons()[index].setChecked(True)
+        button = self._button_by_model.get(model_size)
+        if button is not None:
+            button.setChecked(True)
 
 
-class OutputFormatSelector(QGroupBox):
+class OutputFormatSelector(SignalBatchMixin, QGroupBox):
     """출력 형식 선택 위젯"""
     
     formats_changed = pyqtSignal(list)
@@ -125,6 +155,8 @@ class OutputFormatSelector(QGroupBox):
     
     def _emit_formats(self):
         """선택된 형식 리스트 시그널 발생"""
+        if self._silenced:
+            return
         self.formats_changed.emit(self.get_formats())
     
     def get_formats(self):
@@ -139,13 +171,15 @@ class OutputFormatSelector(QGroupBox):
         return formats
     
     def set_formats(self, formats):
-        """출력 형식 설정"""
-        self.txt_check.setChecked('txt' in formats)
-        self.srt_check.setChecked('srt' in formats)
-        self.pdf_check.setChecked('pdf' in formats)
+        """출력 형식 설정 (시그널은 마지막에 한 번만 발생)"""
+        with self.suppress_signals():
+            self.txt_check.setChecked('txt' in formats)
+            self.srt_check.setChecked('srt' in formats)
+            self.pdf_check.setChecked('pdf' in formats)
+        self._emit_formats()
 
 
-class SummaryOptions(QGroupBox):
+class SummaryOptions(SignalBatchMixin, QGroupBox):
     """요약 옵션 위젯"""
     
     options_changed = pyqtSignal(bool, float)  # enabled, ratio
@@ -180,6 +214,8 @@ class SummaryOptions(QGroupBox):
     
     def _emit_options(self):
         """옵션 변경 시그널 발생"""
+        if self._silenced:
+            return
         self.options_changed.emit(
             self.enable_check.isChecked(),
             self.ratio_spin.value() / 100.0
@@ -193,16 +229,25 @@ class SummaryOptions(QGroupBox):
         }
     
     def set_options(self, enabled, ratio):
-        """요약 옵션 설정"""
-        self.enable_check.setChecked(enabled)
-        self.ratio_spin.setValue(int(ratio * 100))
+        """요약 옵션 설정 (시그널은 마지막에 한 번만 발생)"""
+        with self.suppress_signals():
+            self.enable_check.setChecked(enabled)
+            self.ratio_spin.setValue(int(ratio * 100))
+        self._emit_options()
 
 
-class TranslationOptions(QGroupBox):
+class TranslationOptions(SignalBatchMixin, QGroupBox):
     """번역 옵션 위젯"""
     
     options_changed = pyqtSignal(bool, str)  # enabled, target_language
     
+    _LANGUAGES = (
+        ("한국어", "ko"),
+        ("영어", "en"),
+        ("일본어", "ja"),
+        ("중국어", "zh"),
+    )
+    
     def __init__(self, title="번역 옵션", parent=None):
         super().__init__(title, parent)
         self._setup_ui()
@@ -217,10 +262,9 @@ class TranslationOptions(QGroupBox):
         lang_layout.addWidget(QLabel("번역 언어:"))
         
         self.lang_combo = QComboBox()
-        self.lang_combo.addItem("한국어", "ko")
-        self.lang_combo.addItem("영어", "en")
-        self.lang_combo.addItem("일본어", "ja")
-        self.lang_combo.addItem("중국어", "zh")
+        for label, code in self._LANGUAGES:
+            self.lang_combo.addItem(label, code)
+        self._index_by_code = {code: i for i, (_, code) in enumerate(self._LANGUAGES)}
         self.lang_combo.currentIndexChanged.connect(self._emit_options)
         
         lang_layout.addWidget(self.lang_combo)
@@ -234,6 +278,8 @@ class TranslationOptions(QGroupBox):
     
     def _emit_options(self):
         """옵션 변경 시그널 발생"""
+        if self._silenced:
+            return
         self.options_changed.emit(
             self.enable_check.isChecked(),
             self.lang_combo.currentData()
@@ -247,9 +293,11 @@ class TranslationOptions(QGroupBox):
         }
     
     def set_options(self, enabled, target_language):
-        """번역 옵션 설정"""
-        self.enable_check.setChecked(enabled)
-        for i in range(self.lang_combo.count()):
-            if self.lang_combo.itemData(i) == target_language:
-                self.lang_combo.setCurrentIndex(i)
-                break
+        """번역 옵션 설정 (시그널은 마지막에 한 번만 발생)"""
+        with self.suppress_signals():
+            self.enable_check.setChecked(enabled)
+            
+            index = self._index_by_code.get(target_language)
+            if index is not None:
+                self.lang_combo.setCurrentIndex(index)
+        self._emit_options()
@@ -4,10 +4,10 @@ Utils 모듈
 """
 from .utils_logger import AppLogger, debug, info, warning, error, critical
 from .utils_config import Config, get_config, set_config, reset_config
-from .utils_validators import FileValidator, ConfigValidator, ValidationError
+from .utils_validators import FileValidator, ConfigValidator, ValidationError, VResult
 
 __all__ = [
     'AppLogger', 'debug', 'info', 'warning', 'error', 'critical',
     'Config', 'get_config', 'set_config', 'reset_config',
-    'FileValidator', 'ConfigValidator', 'ValidationError'
+    'FileValidator', 'ConfigValidator', 'ValidationError', 'VResult'
 ]  
\ No newline at end of file
@@ -3,10 +3,22 @@
 사용자 설정을 JSON 파일로 저장하고 불러옵니다.
 """
 import json
+import os
+from contextlib import contextmanager
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict
 from utils.logger import AppLogger
 
+try:
+    import orjson
+    
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dumps(data) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 
 class Config:
     """설정 관리 싱글톤 클래스"""
@@ -14,9 +26,11 @@ class Config:
     _instance = None
     _config_file = Path.home() / '.whisper_app' / 'config.json'
     _config_data = {}
+    _dirty = False  # 저장되지 않은 변경 여부
+    _batch_depth = 0  # batch() 중첩 깊이
     
-    # 기본 설정값
-    _defaults = {
+    # 기본 설정값 (읽기 전용)
+    _defaults = MappingProxyType({
         'language': None,  # 자동 감지
         'model_size': 'medium',
         'output_formats': ['txt', 'srt', 'pdf'],
@@ -26,7 +40,8 @@ class Config:
         'target_language': 'ko',
         'last_directory': str(Path.home()),
         'window_geometry': None,
-    }
+        'use_native_dialog': True,  # False면 Qt 자체 파일 다이얼로그 사용 (원격 마운트용)
+    })
     
     def __new__(cls):
         if cls._instance is None:
@@ -56,10 +71,12 @@ class Config:
             # 디렉토리 생성
             self._config_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # JSON 저장
-            with open(self._config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config_data, f, indent=2, ensure_ascii=False)
+            # 임시 파일에 쓴 뒤 교체 (저장 도중 종료되어도 기존 파일 유지)
+            tmp_file = self._config_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(_dumps(self._config_data))
+            os.replace(tmp_file, self._config_file)
             
+            self._dirty = False
             AppLogger.debug("설정 파일 저장 완료")
         except Exception as e:
             AppLogger.error(f"설정 파일 저장 실패: {e}")
@@ -69,9 +86,34 @@ class Config:
         return self._config_data.get(key, default)
     
     def set(self, key: str, value: Any):
-        """설정값 저장하기"""
+        """설정값 저장하기 (batch() 안에서는 블록이 끝날 때 한 번에 저장)"""
         self._config_data[key] = value
-        self._save_config()
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._save_config()
+    
+    def flush(self):
+        """저장되지 않은 변경이 있으면 파일에 기록"""
+        if self._dirty:
+            self._save_config()
+    
+    @contextmanager
+    def batch(self):
+        """
+        여러 설정 변경을 묶어서 한 번만 저장
+        
+        Example:
+            with Config.instance().batch():
+                set_config('language', 'ko')
+                set_config('model_size', 'small')
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
     
     def get_all(self) -> Dict[str, Any]:
         """모든 설정값 가져오기"""
@@ -89,17 +131,9 @@ class Config:
         return cls()
 
 
-# 편의를 위한 전역 함수들
-def get_config(key: str, default: Any = None) -> Any:
-    """설정값 가져오기"""
-    return Config.instance().get(key, default)
-
-
-def set_config(key: str, value: Any):
-    """설정값 저장하기"""
-    Config.instance().set(key, value)
-
+# 편의를 위한 전역 함수들 (싱글톤을 한 번만 조회해 바운드 메서드로 노출)
+_CFG = Config()
 
-def reset_config():
-    """설정 초기화"""
-    Config.instance().reset_to_defaults()
+get_config = _CFG.get
+set_config = _CFG.set
+reset_config = _CFG.reset_to_defaults
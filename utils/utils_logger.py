@@ -2,42 +2,70 @@
 로깅 설정 모듈
 애플리케이션 전체의 로깅을 관리합니다.
 """
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from pathlib import Path
 
 
+# 로그 파일 경로 (날짜별, 모듈 로드 시 한 번 결정)
+_LOG_FILE = Path.home() / '.whisper_app' / 'logs' / f'whisper_app_{datetime.now():%Y%m%d}.log'
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    버퍼링된 파일 핸들러
+    
+    레코드마다 flush 하지 않고 64KB 버퍼가 찰 때나 close() 시에 기록합니다.
+    """
+    
+    BUFFER_SIZE = 1 << 16
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                    encoding=self.encoding)
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
 class AppLogger:
-    """애플리케이션 로거 싱글톤 클래스"""
+    """
+    애플리케이션 로거 클래스
+    
+    로거 설정은 클래스에 한 번만 적용되며, 이후 생성되는 인스턴스는 같은 로거를 공유합니다.
+    """
     
-    _instance = None
     _logger = None
+    _listener = None
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._setup_logger()
-        return cls._instance
+    def __init__(self):
+        if AppLogger._listener is None:
+            AppLogger._setup_logger()
     
-    def _setup_logger(self):
+    @classmethod
+    def _setup_logger(cls):
         """로거 초기 설정"""
         # 로그 디렉토리 생성
-        log_dir = Path.home() / '.whisper_app' / 'logs'
-        log_dir.mkdir(parents=True, exist_ok=True)
-        
-        # 로그 파일명 (날짜별)
-        log_file = log_dir / f'whisper_app_{datetime.now():%Y%m%d}.log'
+        _LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
         
         # 로거 생성
-        self._logger = logging.getLogger('WhisperApp')
-        self._logger.setLevel(logging.DEBUG)
+        cls._logger = logging.getLogger('WhisperApp')
+        cls._logger.setLevel(logging.DEBUG)
         
         # 기존 핸들러 제거 (중복 방지)
-        self._logger.handlers.clear()
+        cls._logger.handlers.clear()
         
-        # 파일 핸들러
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # 파일 핸들러 (첫 기록 시점에 파일을 엶)
+        file_handler = _BufferedFileHandler(_LOG_FILE, encoding='utf-8', delay=True)
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -52,57 +80,50 @@ class AppLogger:
         )
         console_handler.setFormatter(console_formatter)
         
-        # 핸들러 추가
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
+        # 호출 스레드는 큐에 넣기만 하고, 실제 기록은 리스너 스레드가 담당
+        log_queue = queue.Queue(-1)
+        cls._logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        
+        cls._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        cls._listener.start()
+        
+        # 종료 시 남은 레코드를 처리한 뒤 버퍼 기록 (등록 역순으로 실행)
+        atexit.register(file_handler.close)
+        atexit.register(cls._listener.stop)
     
     def get_logger(self):
         """로거 인스턴스 반환"""
         return self._logger
-    
-    @classmethod
-    def debug(cls, message):
-        """디버그 로그"""
-        logger = cls().get_logger()
-        logger.debug(message)
-    
-    @classmethod
-    def info(cls, message):
-        """정보 로그"""
-        logger = cls().get_logger()
-        logger.info(message)
-    
-    @classmethod
-    def warning(cls, message):
-        """경고 로그"""
-        logger = cls().get_logger()
-        logger.warning(message)
-    
-    @classmethod
-    def error(cls, message):
-        """에러 로그"""
-        logger = cls().get_logger()
-        logger.error(message)
-    
-    @classmethod
-    def critical(cls, message):
-        """치명적 에러 로그"""
-        logger = cls().get_logger()
-        logger.critical(message)
 
 
-# 편의를 위한 전역 함수들
-def debug(message):
-    AppLogger.debug(message)
+# 모듈 로드 시 로거를 한 번만 구성
+_APP = AppLogger()
+_LOGGER = _APP.get_logger()
+
+# AppLogger.info() 등은 로거 메서드를 직접 호출
+AppLogger.debug = staticmethod(_LOGGER.debug)
+AppLogger.info = staticmethod(_LOGGER.info)
+AppLogger.warning = staticmethod(_LOGGER.warning)
+AppLogger.error = staticmethod(_LOGGER.error)
+AppLogger.critical = staticmethod(_LOGGER.critical)
+
+
+# 편의를 위한 전역 함수들 (%-포맷 인자는 레코드가 실제로 기록될 때만 포맷됨)
+def debug(message, *args):
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(message, *args)
 
-def info(message):
-    AppLogger.info(message)
+def info(message, *args):
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(message, *args)
 
-def warning(message):
-    AppLogger.warning(message)
+def warning(message, *args):
+    _LOGGER.warning(message, *args)
 
-def error(message):
-    AppLogger.error(message)
+def error(message, *args):
+    _LOGGER.error(message, *args)
 
-def critical(message):
-    AppLogger.critical(message)
+def critical(message, *args):
+    _LOGGER.critical(message, *args)
@@ -3,8 +3,38 @@
 파일, 설정값 등의 유효성을 검사합니다.
 """
 import os
+import stat
+import time
+from enum import IntEnum
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+
+class VResult(IntEnum):
+    """파일 검증 결과 코드"""
+    OK = 0
+    EMPTY = 1
+    MISSING = 2
+    NOT_FILE = 3
+    TOO_BIG = 4
+    BAD_EXT = 5
+    NO_READ = 6
+
+
+# 검증 결과 코드별 메시지 (화면에 표시할 때만 조회)
+_MESSAGES = {
+    VResult.OK: "파일 검증 성공",
+    VResult.EMPTY: "파일이 선택되지 않았습니다.",
+    VResult.MISSING: "파일을 찾을 수 없습니다.",
+    VResult.NOT_FILE: "유효한 파일이 아닙니다.",
+    VResult.TOO_BIG: "파일 크기가 너무 큽니다 (최대 2GB).",
+    VResult.BAD_EXT: "지원하지 않는 파일 형식입니다",
+    VResult.NO_READ: "파일 읽기 권한이 없습니다.",
+}
+
+# validate_file 결과 캐시: 파일 경로 -> (검사 시각, 결과)
+_STAT_CACHE: Dict[str, Tuple[float, VResult]] = {}
+_STAT_CACHE_TTL = 2.0  # 초
 
 
 class ValidationError(Exception):
@@ -16,11 +46,12 @@ class FileValidator:
     """파일 검증 클래스"""
     
     # 지원하는 파일 확장자
-    SUPPORTED_AUDIO_FORMATS = ['.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac']
-    SUPPORTED_VIDEO_FORMATS = ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm']
+    SUPPORTED_AUDIO_FORMATS = frozenset({'.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac'})
+    SUPPORTED_VIDEO_FORMATS = frozenset({'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm'})
+    _ALL_FORMATS = SUPPORTED_AUDIO_FORMATS | SUPPORTED_VIDEO_FORMATS
     
     @classmethod
-    def validate_file(cls, file_path: str) -> Tuple[bool, str]:
+    def validate_file(cls, file_path: str) -> VResult:
         """
         파일 유효성 검사
         
@@ -28,54 +59,82 @@ class FileValidator:
             file_path: 검사할 파일 경로
             
         Returns:
-            (성공 여부, 메시지) 튜플
+            검증 결과 코드 (메시지는 get_message()로 조회)
         """
         if not file_path:
-            return False, "파일이 선택되지 않았습니다."
+            return VResult.EMPTY
+        
+        # 선택 직후 변환 시작 등 짧은 간격의 재검사는 캐시에서 반환
+        now = time.monotonic()
+        cached = _STAT_CACHE.get(file_path)
+        if cached and now - cached[0] < _STAT_CACHE_TTL:
+            return cached[1]
+        
+        result = cls._check_file(file_path)
         
-        path = Path(file_path)
+        # 만료된 항목 정리
+        for key in [k for k, (ts, _) in _STAT_CACHE.items() if now - ts >= _STAT_CACHE_TTL]:
+            del _STAT_CACHE[key]
+        _STAT_CACHE[file_path] = (now, result)
         
+        return result
+    
+    @classmethod
+    def _check_file(cls, file_path: str) -> VResult:
+        """파일 유효성 실제 검사 (stat 한 번으로 존재/종류/크기 확인)"""
         # 파일 존재 확인
-        if not path.exists():
-            return False, "파일을 찾을 수 없습니다."
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return VResult.MISSING
         
         # 파일인지 확인
-        if not path.is_file():
-            return False, "유효한 파일이 아닙니다."
+        if not stat.S_ISREG(st.st_mode):
+            return VResult.NOT_FILE
         
         # 파일 크기 확인 (최대 2GB)
-        file_size = path.stat().st_size
         max_size = 2 * 1024 * 1024 * 1024  # 2GB
-        if file_size > max_size:
-            return False, f"파일 크기가 너무 큽니다 (최대 2GB). 현재: {file_size / (1024**3):.2f}GB"
+        if st.st_size > max_size:
+            return VResult.TOO_BIG
         
         # 파일 확장자 확인
-        ext = path.suffix.lower()
-        supported_formats = cls.SUPPORTED_AUDIO_FORMATS + cls.SUPPORTED_VIDEO_FORMATS
-        
-        if ext not in supported_formats:
-            return False, f"지원하지 않는 파일 형식입니다: {ext}"
+        if Path(file_path).suffix.lower() not in cls._ALL_FORMATS:
+            return VResult.BAD_EXT
         
         # 파일 읽기 권한 확인
         if not os.access(file_path, os.R_OK):
-            return False, "파일 읽기 권한이 없습니다."
+            return VResult.NO_READ
+        
+        return VResult.OK
+    
+    @staticmethod
+    def get_message(result: VResult, file_path: Optional[str] = None) -> str:
+        """
+        검증 결과 코드에 해당하는 메시지 반환
         
-        return True, "파일 검증 성공"
+        Args:
+            result: validate_file() 결과
+            file_path: 검사한 파일 경로 (형식 오류 메시지에 확장자를 덧붙일 때 사용)
+        """
+        message = _MESSAGES[result]
+        if result == VResult.BAD_EXT and file_path:
+            message = f"{message}: {Path(file_path).suffix.lower()}"
+        return message
     
     @classmethod
     def get_supported_formats_string(cls) -> str:
         """지원하는 파일 형식 문자열 반환"""
-        audio = ', '.join(cls.SUPPORTED_AUDIO_FORMATS)
-        video = ', '.join(cls.SUPPORTED_VIDEO_FORMATS)
+        audio = ', '.join(sorted(cls.SUPPORTED_AUDIO_FORMATS))
+        video = ', '.join(sorted(cls.SUPPORTED_VIDEO_FORMATS))
         return f"오디오: {audio}\n비디오: {video}"
 
 
 class ConfigValidator:
     """설정값 검증 클래스"""
     
-    VALID_LANGUAGES = ['ko', 'en', 'ja', 'zh']
-    VALID_MODEL_SIZES = ['tiny', 'base', 'small', 'medium', 'large']
-    VALID_OUTPUT_FORMATS = ['txt', 'srt', 'pdf']
+    VALID_LANGUAGES = frozenset({'ko', 'en', 'ja', 'zh'})
+    VALID_MODEL_SIZES = frozenset({'tiny', 'base', 'small', 'medium', 'large'})
+    VALID_OUTPUT_FORMATS = frozenset({'txt', 'srt', 'pdf'})
     
     @classmethod
     def validate_language(cls, language: str) -> bool:
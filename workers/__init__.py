@@ -1,11 +1,21 @@
 """
 Workers 모듈
 비동기 백그라운드 작업을 처리합니다.
+
+워커 클래스는 처음 접근할 때 임포트합니다 (PEP 562).
 """
-from .workers_base import BaseWorker
-from .workers_transcription import TranscriptionWorker
 
 __all__ = [
     'BaseWorker',
     'TranscriptionWorker'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name == 'BaseWorker':
+        from .workers_base import BaseWorker
+        return BaseWorker
+    if name == 'TranscriptionWorker':
+        from .workers_transcription import TranscriptionWorker
+        return TranscriptionWorker
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 기본 워커 모듈
 취소 가능한 비동기 작업의 베이스 클래스
 """
+import time
 from PyQt5.QtCore import QThread, pyqtSignal
 from utils.logger import info, warning, error
 
@@ -22,9 +23,14 @@ class BaseWorker(QThread):
     finished = pyqtSignal(bool, object)  # 성공 여부, 결과
     error_occurred = pyqtSignal(str)    # 에러 메시지
     
+    STATUS_MIN_INTERVAL = 0.05  # 같은 상태 메시지 재전송 최소 간격 (초)
+    
     def __init__(self):
         super().__init__()
         self._is_cancelled = False
+        self._last_progress = -1
+        self._last_status = None
+        self._last_status_ts = 0.0
     
     def run(self):
         """
@@ -39,8 +45,19 @@ class BaseWorker(QThread):
         self.requestInterruption()
     
     def is_cancelled(self) -> bool:
-        """취소 여부 확인"""
-        return self._is_cancelled or self.isInterruptionRequested()
+        """취소 여부 확인 (콜백마다 호출되므로 플래그만 확인)"""
+        return self._is_cancelled
+    
+    def _check_interrupt_periodically(self) -> bool:
+        """
+        파이프라인 단계 사이에서 Qt 인터럽트 요청을 플래그에 반영
+        
+        Returns:
+            취소 여부
+        """
+        if not self._is_cancelled and self.isInterruptionRequested():
+            self._is_cancelled = True
+        return self._is_cancelled
     
     def update_progress(self, value: int):
         """
@@ -49,8 +66,15 @@ class BaseWorker(QThread):
         Args:
             value: 진행률 (0-100)
         """
-        if not self.is_cancelled():
-            self.progress_updated.emit(max(0, min(100, value)))
+        if self.is_cancelled():
+            return
+        
+        value = max(0, min(100, value))
+        if value == self._last_progress:
+            return
+        
+        self._last_progress = value
+        self.progress_updated.emit(value)
     
     def update_status(self, message: str):
         """
@@ -59,8 +83,17 @@ class BaseWorker(QThread):
         Args:
             message: 상태 메시지
         """
-        if not self.is_cancelled():
-            self.status_updated.emit(message)
+        if self.is_cancelled():
+            return
+        
+        # 같은 메시지가 짧은 간격으로 반복되면 생략
+        now = time.monotonic()
+        if message == self._last_status and now - self._last_status_ts < self.STATUS_MIN_INTERVAL:
+            return
+        
+        self._last_status = message
+        self._last_status_ts = now
+        self.status_updated.emit(message)
     
     def emit_error(self, message: str):
         """
@@ -2,10 +2,10 @@
 전사 워커 모듈
 음성/비디오 파일 전사 작업을 비동기로 처리합니다.
 """
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional, List
 from pathlib import Path
 from workers.base_worker import BaseWorker
-from core import WhisperProcessor, TextSummarizer, Translator, FileHandler
 from utils.logger import info, error
 
 
@@ -16,6 +16,9 @@ class TranscriptionWorker(BaseWorker):
     전사 -> 요약 -> 번역 -> 파일 생성의 전체 파이프라인을 처리합니다.
     """
     
+    # 세그먼트 번역 요청 하나에 담을 세그먼트 수
+    TRANSLATION_BATCH = 64
+    
     def __init__(
         self,
         file_path: str,
@@ -49,12 +52,15 @@ class TranscriptionWorker(BaseWorker):
     def run(self):
         """전사 작업 실행"""
         try:
-            info(f"전사 작업 시작: {self.file_path}")
+            info("전사 작업 시작: %s", self.file_path)
             
             # === 1단계: 모델 로드 (10%) ===
             self.update_progress(0)
             self.update_status("Whisper 모델 로드 중...")
             
+            # core 모듈은 torch/whisper 등을 끌어오므로 필요한 시점에 서브모듈 단위로 임포트
+            from core.core_whisper import WhisperProcessor
+            
             processor = WhisperProcessor.get_instance()
             
             if not processor.load_model(
@@ -65,7 +71,7 @@ class TranscriptionWorker(BaseWorker):
                 self.emit_finished(False)
                 return
             
-            if self.is_cancelled():
+            if self._check_interrupt_periodically():
                 self.emit_finished(False, "작업이 취소되었습니다")
                 return
             
@@ -77,7 +83,8 @@ class TranscriptionWorker(BaseWorker):
             transcription_result = processor.transcribe(
                 self.file_path,
                 self.language,
-                progress_callback=self.update_status
+                progress_callback=self.update_status,
+                model_size=self.model_size
             )
             
             if not transcription_result:
@@ -85,7 +92,7 @@ class TranscriptionWorker(BaseWorker):
                 self.emit_finished(False)
                 return
             
-            if self.is_cancelled():
+            if self._check_interrupt_periodically():
                 self.emit_finished(False, "작업이 취소되었습니다")
                 return
             
@@ -100,6 +107,8 @@ class TranscriptionWorker(BaseWorker):
             if self.enable_summary:
                 self.update_status("텍스트 요약 생성 중...")
                 
+                from core.core_summarizer import TextSummarizer
+                
                 summarizer = TextSummarizer()
                 summary_text = summarizer.summarize(
                     transcript_text,
@@ -110,7 +119,7 @@ class TranscriptionWorker(BaseWorker):
                 if summary_text:
                     self.result['summary'] = summary_text
                 
-                if self.is_cancelled():
+                if self._check_interrupt_periodically():
                     self.emit_finished(False, "작업이 취소되었습니다")
                     return
             
@@ -124,29 +133,52 @@ class TranscriptionWorker(BaseWorker):
             if self.enable_translation:
                 self.update_status(f"{self.target_language}로 번역 중...")
                 
-                translator = Translator()
+                from core.translator import Translator
                 
-                # 전체 텍스트 번역
-                translated_text = translator.translate_text(
-                    transcript_text,
-                    self.target_language,
-                    progress_callback=self.update_status
-                )
+                translator = Translator()
                 
-                # 요약 번역
-                if summary_text:
-                    translated_summary = translator.translate_text(
+                # 요약 / 세그먼트 번역은 서로 독립적이므로 동시에 요청
+                # (전체 텍스트는 번역된 세그먼트를 이어 붙여 만들므로 따로 요청하지 않음)
+                executor = ThreadPoolExecutor(max_workers=2)
+                cancelled = False
+                try:
+                    f_summary = executor.submit(
+                        translator.translate_text,
                         summary_text,
                         self.target_language,
                         progress_callback=self.update_status
+                    ) if summary_text else None
+                    f_segments = executor.submit(
+                        self._batched_translate,
+                        translator,
+                        segments,
+                        self.target_language,
+                        self.language or transcription_result.get('language') or 'auto'
                     )
+                    
+                    pending = {f for f in (f_summary, f_segments) if f is not None}
+                    while pending:
+                        _, pending = wait(pending, timeout=0.1)
+                        if self._check_interrupt_periodically():
+                            cancelled = True
+                            for future in pending:
+                                future.cancel()
+                            break
+                finally:
+                    # 취소된 경우 진행 중인 요청을 기다리지 않음
+                    executor.shutdown(wait=not cancelled)
                 
-                # 세그먼트 번역
-                translated_segments = translator.translate_segments(
-                    segments,
-                    self.target_language,
-                    progress_callback=self.update_status
-                )
+                if cancelled:
+                    self.emit_finished(False, "작업이 취소되었습니다")
+                    return
+                
+                translated_summary = f_summary.result() if f_summary else None
+                translated_segments = f_segments.result()
+                
+                if translated_segments:
+                    translated_text = "\n".join(
+                        segment['text'].strip() for segment in translated_segments
+                    )
                 
                 self.result['translation'] = {
                     'text': translated_text,
@@ -154,7 +186,7 @@ class TranscriptionWorker(BaseWorker):
                     'segments': translated_segments
                 }
                 
-                if self.is_cancelled():
+                if self._check_interrupt_periodically():
                     self.emit_finished(False, "작업이 취소되었습니다")
                     return
             
@@ -172,7 +204,7 @@ class TranscriptionWorker(BaseWorker):
                 translated_segments
             )
             
-            if self.is_cancelled():
+            if self._check_interrupt_periodically():
                 self.emit_finished(False, "작업이 취소되었습니다")
                 return
             
@@ -185,10 +217,49 @@ class TranscriptionWorker(BaseWorker):
             self.emit_finished(True, self.result)
             
         except Exception as e:
-            error(f"전사 작업 중 예외 발생: {e}")
+            error("전사 작업 중 예외 발생: %s", e)
             self.emit_error(f"작업 실패: {str(e)}")
             self.emit_finished(False)
     
+    def _batched_translate(
+        self,
+        translator,
+        segments: list,
+        target_language: str,
+        source_language: str = 'auto',
+        batch: int = TRANSLATION_BATCH
+    ) -> Optional[list]:
+        """
+        세그먼트를 batch 개씩 묶어 번역
+        
+        한 라운드에 Translator.MAX_WORKERS 개의 요청을 동시에 보내고,
+        라운드 사이에서 취소 여부와 진행 상황을 확인합니다.
+        
+        Returns:
+            번역된 세그먼트 리스트 또는 None (실패하거나 취소된 경우)
+        """
+        total = len(segments)
+        round_size = batch * translator.MAX_WORKERS
+        translated_segments = []
+        
+        for start in range(0, total, round_size):
+            if self.is_cancelled():
+                return None
+            
+            translated = translator.translate_segments(
+                segments[start:start + round_size],
+                target_language,
+                source_language,
+                batch_size=batch
+            )
+            if translated is None:
+                return None
+            
+            translated_segments.extend(translated)
+            self.update_status(f"세그먼트 번역 중... ({len(translated_segments)}/{total})")
+        
+        return translated_segments
+    
     def _create_output_files(
         self,
         transcript_text: str,
@@ -198,84 +269,112 @@ class TranscriptionWorker(BaseWorker):
         translated_summary: Optional[str],
         translated_segments: Optional[list]
     ) -> List[str]:
-        """출력 파일 생성"""
-        created_files = []
+        """출력 파일 생성 (형식별 작성기를 동시에 실행)"""
+        from core.core_file_handler import FileHandler
+        
         file_handler = FileHandler()
         
-        base_name = Path(self.file_path).stem
-        output_dir = Path(self.file_path).parent
+        # 입력 경로는 한 번만 파싱
+        input_path = Path(self.file_path)
+        base_name = input_path.stem
+        output_dir = input_path.parent
+        
+        def output_path(suffix: str, extension: str) -> str:
+            return FileHandler.build_output_path(output_dir, base_name, suffix, extension)
+        
+        # 각 작업은 생성에 성공한 파일 경로 리스트를 반환
+        tasks = []
         
-        # TXT 파일들
+        def add_task(create, output_file, *args, **kwargs):
+            tasks.append(
+                lambda: [output_file] if create(*args, output_file, **kwargs) else []
+            )
+        
+        # TXT 파일들 (한 번에 생성, 작성 스레드에서는 인코딩 없이 기록만)
         if 'txt' in self.output_formats:
-            # 원본 전사
-            txt_file = FileHandler.get_output_path(self.file_path, "", "txt")
-            if file_handler.create_txt(transcript_text, txt_file, self.update_status):
-                created_files.append(txt_file)
-            
-            # 요약
-            if summary_text:
-                summary_file = FileHandler.get_output_path(self.file_path, "_summary", "txt")
-                if file_handler.create_txt(summary_text, summary_file, self.update_status):
-                    created_files.append(summary_file)
-            
-            # 번역
-            if translated_text:
-                trans_file = FileHandler.get_output_path(
-                    self.file_path, f"_{self.target_language}", "txt"
+            txt_items = [
+                (output_path(suffix, "txt"),
+                 text.encode('utf-8'))
+                for suffix, text in (
+                    ("", transcript_text),
+                    ("_summary", summary_text),
+                    (f"_{self.target_language}", translated_text),
+                    (f"_summary_{self.target_language}", translated_summary),
                 )
-                if file_handler.create_txt(translated_text, trans_file, self.update_status):
-                    created_files.append(trans_file)
-            
-            # 번역된 요약
-            if translated_summary:
-                trans_summary_file = FileHandler.get_output_path(
-                    self.file_path, f"_summary_{self.target_language}", "txt"
-                )
-                if file_handler.create_txt(translated_summary, trans_summary_file, self.update_status):
-                    created_files.append(trans_summary_file)
+                if text
+            ]
+            tasks.append(
+                lambda: file_handler.create_txt_batch(txt_items, self.update_status)
+            )
         
         # SRT 파일들
         if 'srt' in self.output_formats:
             # 원본 자막
-            srt_file = FileHandler.get_output_path(self.file_path, "", "srt")
-            if file_handler.create_srt(segments, srt_file, self.update_status):
-                created_files.append(srt_file)
+            add_task(
+                file_handler.create_srt,
+                output_path("", "srt"),
+                segments,
+                progress_callback=self.update_status
+            )
             
             # 번역된 자막
             if translated_segments:
-                trans_srt_file = FileHandler.get_output_path(
-                    self.file_path, f"_{self.target_language}", "srt"
+                add_task(
+                    file_handler.create_srt,
+                    output_path(f"_{self.target_language}", "srt"),
+                    translated_segments,
+                    progress_callback=self.update_status
                 )
-                if file_handler.create_srt(translated_segments, trans_srt_file, self.update_status):
-                    created_files.append(trans_srt_file)
         
         # PDF 파일들
         if 'pdf' in self.output_formats:
             # 원본 PDF
-            pdf_file = FileHandler.get_output_path(self.file_path, "_transcript", "pdf")
-            if file_handler.create_pdf(
+            add_task(
+                file_handler.create_pdf,
+                output_path("_transcript", "pdf"),
                 segments,
-                pdf_file,
                 title=f"{base_name} - Transcript",
                 full_text=transcript_text,
                 summary_text=summary_text,
                 progress_callback=self.update_status
-            ):
-                created_files.append(pdf_file)
+            )
             
             # 번역된 PDF
             if translated_segments:
-                trans_pdf_file = FileHandler.get_output_path(
-                    self.file_path, f"_transcript_{self.target_language}", "pdf"
-                )
-                if file_handler.create_pdf(
+                add_task(
+                    file_handler.create_pdf,
+                    output_path(f"_transcript_{self.target_language}", "pdf"),
                     translated_segments,
-                    trans_pdf_file,
                     title=f"{base_name} - Transcript ({self.target_language})",
                     full_text=translated_text,
                     summary_text=translated_summary,
                     progress_callback=self.update_status
-                ):
-                    created_files.append(trans_pdf_file)
+                )
+        
+        if not tasks:
+            return []
+        
+        # TXT/SRT(I/O)와 PDF(CPU) 작성을 겹쳐서 실행하고 100ms 간격으로 취소 여부 확인
+        executor = ThreadPoolExecutor(max_workers=min(6, len(tasks)))
+        cancelled = False
+        try:
+            futures = [executor.submit(task) for task in tasks]
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, timeout=0.1)
+                if self._check_interrupt_periodically():
+                    cancelled = True
+                    for future in pending:
+                        future.cancel()
+                    break
+        finally:
+            # 취소된 경우 이미 실행 중인 작성기를 기다리지 않음
+            executor.shutdown(wait=not cancelled)
+        
+        # 결과는 제출 순서대로 수집 (취소 시 완료된 작업만)
+        created_files = []
+        for future in futures:
+            if future.done() and not future.cancelled():
+                created_files.extend(future.result())
         
-        return created_files
\ No newline at end of file
+        return created_files